@@ -0,0 +1,42 @@
+"""In-process TTL cache for the product catalog.
+
+Products change rarely but are read on almost every request (device
+install, detail endpoints, Excel upload), so cache lookups by id and
+product_code for a few minutes and invalidate on any catalog write.
+"""
+import time
+
+# Seconds a cached product stays valid
+PRODUCT_TTL = 300
+
+_products_by_id = {}
+_products_by_code = {}
+
+def get_cached_product(product_id=None, product_code=None):
+    """Return a cached Product, or None on miss/expiry"""
+    if product_id is not None:
+        store, key = _products_by_id, product_id
+    else:
+        store, key = _products_by_code, product_code
+
+    entry = store.get(key)
+    if entry is None:
+        return None
+
+    product, expires_at = entry
+    if time.monotonic() >= expires_at:
+        store.pop(key, None)
+        return None
+    return product
+
+def cache_product(product):
+    """Store a product under both its id and product_code"""
+    expires_at = time.monotonic() + PRODUCT_TTL
+    _products_by_id[product.id] = (product, expires_at)
+    if product.product_code:
+        _products_by_code[product.product_code] = (product, expires_at)
+
+def invalidate_products():
+    """Drop all cached products (call after any catalog write)"""
+    _products_by_id.clear()
+    _products_by_code.clear()
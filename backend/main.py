@@ -1,28 +1,45 @@
 from fastapi import FastAPI, Depends, HTTPException, File, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import List
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-import io
+import os
 import random
-import string
+import tempfile
 
 from database import engine, get_db, Base
 from models import Product, Warehouse, InstalledDevice
+from cache import get_cached_product, cache_product, invalidate_products
 import schemas
 
+# orjson serializes responses in native code - it dominates for the list
+# endpoints that return many nested device/product models
+app = FastAPI(title="Digital Twin Warehouse API", default_response_class=ORJSONResponse)
+
 # Create tables
-Base.metadata.create_all(bind=engine)
+@app.on_event("startup")
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
-app = FastAPI(title="Digital Twin Warehouse API")
+# CORS configuration - explicit origin/method lists let the middleware
+# short-circuit on set membership instead of wildcard handling per request
+ALLOWED_ORIGINS = os.getenv(
+    "ALLOWED_ORIGINS",
+    "http://localhost:3000,http://127.0.0.1:3000"
+).split(",")
 
-# CORS configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend URL
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
 )
 
@@ -33,44 +50,99 @@ app.add_middleware(
 def generate_serial_number(product_code: str) -> str:
     """Generate unique serial number"""
     prefix = product_code[:3].upper()
-    random_part = ''.join(random.choices(string.digits, k=6))
-    return f"SN-{prefix}-{random_part}"
+    return f"SN-{prefix}-{random.randrange(1_000_000):06d}"
 
 def calculate_warranty_expiry(installation_date: datetime, warranty_years: int) -> datetime:
     """Calculate warranty expiration date"""
     return installation_date + timedelta(days=365 * warranty_years)
 
+def read_excel_plan(file_obj) -> pd.DataFrame:
+    """Parse an uploaded spreadsheet, preferring the Rust-backed calamine engine"""
+    try:
+        return pd.read_excel(file_obj, engine="calamine")
+    except ImportError:
+        # python-calamine not installed - fall back to the default engine
+        file_obj.seek(0)
+        return pd.read_excel(file_obj)
+
+# Above this row count, PostgreSQL ingests go through COPY instead of INSERT
+COPY_MIN_ROWS = 500
+
+# Rows per multi-VALUES INSERT on dialects without COPY; keeps the bound
+# parameter count under driver limits (SQLite caps around 32k)
+INSERT_BATCH_ROWS = 500
+
+# Abort an Excel upload after this many consecutive bad rows - at that
+# point the sheet almost certainly doesn't match the catalog at all
+MAX_CONSECUTIVE_ERRORS = 100
+
+# Column order shared by the COPY records and the INSERT fallback
+DEVICE_ROW_COLUMNS = [
+    "warehouse_id", "product_id", "serial_number", "floor_number",
+    "position_x", "position_y", "position_z", "rotation_y",
+    "installation_date", "warranty_expiry",
+    "health_score", "status", "notes",
+    "is_active", "created_at", "updated_at"
+]
+
+async def bulk_insert_devices(db: AsyncSession, rows: list) -> None:
+    """Bulk-insert device rows, using asyncpg COPY for large PostgreSQL loads"""
+    if db.bind.dialect.name == "postgresql" and len(rows) >= COPY_MIN_ROWS:
+        conn = await db.connection()
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "installed_devices",
+            records=[tuple(row[col] for col in DEVICE_ROW_COLUMNS) for row in rows],
+            columns=DEVICE_ROW_COLUMNS,
+        )
+    else:
+        # One multi-VALUES statement per batch instead of one INSERT per
+        # row, amortizing protocol round-trips on SQLite and friends
+        for start in range(0, len(rows), INSERT_BATCH_ROWS):
+            await db.execute(insert(InstalledDevice).values(rows[start:start + INSERT_BATCH_ROWS]))
+
 # ============================================================
 # PRODUCT ENDPOINTS
 # ============================================================
 
 @app.post("/products/", response_model=schemas.Product)
-def create_product(product: schemas.ProductCreate, db: Session = Depends(get_db)):
+async def create_product(product: schemas.ProductCreate, db: AsyncSession = Depends(get_db)):
     """Add a new product to the catalog"""
     db_product = Product(**product.model_dump())
     db.add(db_product)
-    db.commit()
-    db.refresh(db_product)
+    await db.commit()
+    await db.refresh(db_product)
+    invalidate_products()
     return db_product
 
 @app.get("/products/", response_model=List[schemas.Product])
-def get_products(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_products(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
     """Get all products from catalog"""
-    products = db.query(Product).offset(skip).limit(limit).all()
-    return products
+    result = await db.execute(select(Product).offset(skip).limit(limit))
+    return result.scalars().all()
 
 @app.get("/products/{product_id}", response_model=schemas.Product)
-def get_product(product_id: int, db: Session = Depends(get_db)):
+async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
     """Get specific product by ID"""
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = get_cached_product(product_id=product_id)
+    if product is None:
+        result = await db.execute(select(Product).where(Product.id == product_id))
+        product = result.scalars().first()
+        if product:
+            cache_product(product)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
 
 @app.get("/products/code/{product_code}", response_model=schemas.Product)
-def get_product_by_code(product_code: str, db: Session = Depends(get_db)):
+async def get_product_by_code(product_code: str, db: AsyncSession = Depends(get_db)):
     """Get product by product code"""
-    product = db.query(Product).filter(Product.product_code == product_code).first()
+    product = get_cached_product(product_code=product_code)
+    if product is None:
+        result = await db.execute(select(Product).where(Product.product_code == product_code))
+        product = result.scalars().first()
+        if product:
+            cache_product(product)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
@@ -80,39 +152,42 @@ def get_product_by_code(product_code: str, db: Session = Depends(get_db)):
 # ============================================================
 
 @app.post("/warehouses/", response_model=schemas.Warehouse)
-def create_warehouse(warehouse: schemas.WarehouseCreate, db: Session = Depends(get_db)):
+async def create_warehouse(warehouse: schemas.WarehouseCreate, db: AsyncSession = Depends(get_db)):
     """Create a new warehouse configuration"""
     db_warehouse = Warehouse(**warehouse.model_dump())
     db.add(db_warehouse)
-    db.commit()
-    db.refresh(db_warehouse)
+    await db.commit()
+    await db.refresh(db_warehouse)
     return db_warehouse
 
 @app.get("/warehouses/", response_model=List[schemas.Warehouse])
-def get_warehouses(db: Session = Depends(get_db)):
+async def get_warehouses(db: AsyncSession = Depends(get_db)):
     """Get all warehouses"""
-    return db.query(Warehouse).all()
+    result = await db.execute(select(Warehouse))
+    return result.scalars().all()
 
 @app.get("/warehouses/{warehouse_id}", response_model=schemas.Warehouse)
-def get_warehouse(warehouse_id: int, db: Session = Depends(get_db)):
+async def get_warehouse(warehouse_id: int, db: AsyncSession = Depends(get_db)):
     """Get specific warehouse"""
-    warehouse = db.query(Warehouse).filter(Warehouse.id == warehouse_id).first()
+    result = await db.execute(select(Warehouse).where(Warehouse.id == warehouse_id))
+    warehouse = result.scalars().first()
     if not warehouse:
         raise HTTPException(status_code=404, detail="Warehouse not found")
     return warehouse
 
 @app.put("/warehouses/{warehouse_id}", response_model=schemas.Warehouse)
-def update_warehouse(warehouse_id: int, warehouse: schemas.WarehouseUpdate, db: Session = Depends(get_db)):
+async def update_warehouse(warehouse_id: int, warehouse: schemas.WarehouseUpdate, db: AsyncSession = Depends(get_db)):
     """Update warehouse configuration"""
-    db_warehouse = db.query(Warehouse).filter(Warehouse.id == warehouse_id).first()
+    result = await db.execute(select(Warehouse).where(Warehouse.id == warehouse_id))
+    db_warehouse = result.scalars().first()
     if not db_warehouse:
         raise HTTPException(status_code=404, detail="Warehouse not found")
-    
+
     for key, value in warehouse.model_dump(exclude_unset=True).items():
         setattr(db_warehouse, key, value)
-    
-    db.commit()
-    db.refresh(db_warehouse)
+
+    await db.commit()
+    await db.refresh(db_warehouse)
     return db_warehouse
 
 # ============================================================
@@ -120,25 +195,31 @@ def update_warehouse(warehouse_id: int, warehouse: schemas.WarehouseUpdate, db:
 # ============================================================
 
 @app.post("/devices/", response_model=schemas.InstalledDevice)
-def install_device(device: schemas.InstalledDeviceCreate, db: Session = Depends(get_db)):
+async def install_device(device: schemas.InstalledDeviceCreate, db: AsyncSession = Depends(get_db)):
     """Install a new device in warehouse"""
     # Verify warehouse exists
-    warehouse = db.query(Warehouse).filter(Warehouse.id == device.warehouse_id).first()
+    result = await db.execute(select(Warehouse).where(Warehouse.id == device.warehouse_id))
+    warehouse = result.scalars().first()
     if not warehouse:
         raise HTTPException(status_code=404, detail="Warehouse not found")
-    
-    # Verify product exists
-    product = db.query(Product).filter(Product.id == device.product_id).first()
+
+    # Verify product exists (cache first - the catalog rarely changes)
+    product = get_cached_product(product_id=device.product_id)
+    if product is None:
+        result = await db.execute(select(Product).where(Product.id == device.product_id))
+        product = result.scalars().first()
+        if product:
+            cache_product(product)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    
+
     # Generate serial number if not provided
     serial_number = device.serial_number or generate_serial_number(product.product_code)
-    
+
     # Calculate warranty expiry
     installation_date = datetime.utcnow()
     warranty_expiry = calculate_warranty_expiry(installation_date, product.warranty_years)
-    
+
     # Create device
     db_device = InstalledDevice(
         **device.model_dump(exclude={'serial_number'}),
@@ -148,52 +229,68 @@ def install_device(device: schemas.InstalledDeviceCreate, db: Session = Depends(
         health_score=100,
         status="Healthy"
     )
-    
+
     db.add(db_device)
-    db.commit()
-    db.refresh(db_device)
+    await db.commit()
+    # Load the product relationship eagerly for the response model
+    await db.refresh(db_device, ["product"])
     return db_device
 
 @app.get("/devices/warehouse/{warehouse_id}", response_model=List[schemas.InstalledDevice])
-def get_warehouse_devices(warehouse_id: int, db: Session = Depends(get_db)):
+async def get_warehouse_devices(warehouse_id: int, db: AsyncSession = Depends(get_db)):
     """Get all devices in a warehouse"""
-    devices = db.query(InstalledDevice).filter(
-        InstalledDevice.warehouse_id == warehouse_id,
-        InstalledDevice.is_active == True
-    ).all()
-    return devices
+    result = await db.execute(
+        select(InstalledDevice)
+        .options(joinedload(InstalledDevice.product))
+        .where(
+            InstalledDevice.warehouse_id == warehouse_id,
+            InstalledDevice.is_active == True
+        )
+    )
+    return result.scalars().all()
 
 @app.get("/devices/{device_id}", response_model=schemas.InstalledDevice)
-def get_device(device_id: int, db: Session = Depends(get_db)):
+async def get_device(device_id: int, db: AsyncSession = Depends(get_db)):
     """Get specific device"""
-    device = db.query(InstalledDevice).filter(InstalledDevice.id == device_id).first()
+    result = await db.execute(
+        select(InstalledDevice)
+        .options(joinedload(InstalledDevice.product))
+        .where(InstalledDevice.id == device_id)
+    )
+    device = result.scalars().first()
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
     return device
 
 @app.put("/devices/{device_id}", response_model=schemas.InstalledDevice)
-def update_device(device_id: int, device: schemas.InstalledDeviceUpdate, db: Session = Depends(get_db)):
+async def update_device(device_id: int, device: schemas.InstalledDeviceUpdate, db: AsyncSession = Depends(get_db)):
     """Update device position, health, etc."""
-    db_device = db.query(InstalledDevice).filter(InstalledDevice.id == device_id).first()
+    result = await db.execute(
+        select(InstalledDevice)
+        .options(joinedload(InstalledDevice.product))
+        .where(InstalledDevice.id == device_id)
+    )
+    db_device = result.scalars().first()
     if not db_device:
         raise HTTPException(status_code=404, detail="Device not found")
-    
+
     for key, value in device.model_dump(exclude_unset=True).items():
         setattr(db_device, key, value)
-    
-    db.commit()
-    db.refresh(db_device)
+
+    await db.commit()
+    await db.refresh(db_device)
     return db_device
 
 @app.delete("/devices/{device_id}")
-def delete_device(device_id: int, db: Session = Depends(get_db)):
+async def delete_device(device_id: int, db: AsyncSession = Depends(get_db)):
     """Remove device from warehouse"""
-    device = db.query(InstalledDevice).filter(InstalledDevice.id == device_id).first()
+    result = await db.execute(select(InstalledDevice).where(InstalledDevice.id == device_id))
+    device = result.scalars().first()
     if not device:
         raise HTTPException(status_code=404, detail="Device not found")
-    
+
     device.is_active = False
-    db.commit()
+    await db.commit()
     return {"message": "Device removed successfully"}
 
 # ============================================================
@@ -204,102 +301,201 @@ def delete_device(device_id: int, db: Session = Depends(get_db)):
 async def upload_excel_plan(
     warehouse_id: int,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Upload Excel file with device installation plan"""
     # Verify warehouse exists
-    warehouse = db.query(Warehouse).filter(Warehouse.id == warehouse_id).first()
+    result = await db.execute(select(Warehouse).where(Warehouse.id == warehouse_id))
+    warehouse = result.scalars().first()
     if not warehouse:
         raise HTTPException(status_code=404, detail="Warehouse not found")
-    
-    # Read Excel file
+
+    # Spool the upload to a temp file chunk-by-chunk (bounded memory), then
+    # parse it in the threadpool so pd.read_excel doesn't block the event loop
     try:
-        contents = await file.read()
-        df = pd.read_excel(io.BytesIO(contents))
+        spool = tempfile.SpooledTemporaryFile(max_size=16 << 20)
+        while chunk := await file.read(64 * 1024):
+            spool.write(chunk)
+        spool.seek(0)
+        df = await run_in_threadpool(read_excel_plan, spool)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading Excel file: {str(e)}")
-    
-    installed_devices = []
+
+    pending_rows = []
+    installed_serials = []
     errors = []
-    
-    # Process each row
-    for idx, row in df.iterrows():
-        try:
-            # Map component name to product
-            component_name = row.get("Component Name") or row.get("ComponentName")
-            if not component_name:
-                errors.append(f"Row {idx + 2}: Missing component name")
-                continue
-            
-            # Find product by name (fuzzy matching)
-            product = db.query(Product).filter(
-                Product.name.ilike(f"%{component_name}%")
-            ).first()
-            
-            if not product:
-                errors.append(f"Row {idx + 2}: Product '{component_name}' not found in catalog")
-                continue
-            
-            # Get quantity (default 1)
-            quantity = int(row.get("Quantity", 1))
-            floor_number = int(row.get("Floor Number", 1))
-            
-            # Get optional coordinates (relative to front door at 0,0,0)
-            pos_x = row.get("Position X")
-            pos_y = row.get("Position Y") 
-            pos_z = row.get("Position Z")
-            
-            # Convert to float if provided, otherwise None
-            coord_x = float(pos_x) if pd.notna(pos_x) else None
-            coord_y = float(pos_y) if pd.notna(pos_y) else None
-            coord_z = float(pos_z) if pd.notna(pos_z) else None
-            
-            # Install multiple devices if quantity > 1
-            for q in range(quantity):
-                serial = row.get("Serial")
-                if serial and quantity > 1:
-                    serial = f"{serial}-{q + 1}"
-                
-                # If coordinates provided, use them; otherwise use default (0, floor_height, 0)
-                if coord_x is not None and coord_z is not None:
-                    # Use provided coordinates
-                    device_x = coord_x
-                    device_z = coord_z
-                    # If Y not provided, calculate from floor
-                    device_y = coord_y if coord_y is not None else (floor_number - 1) * warehouse.floor_height
-                else:
-                    # No coordinates - place at origin for manual positioning
-                    device_x = 0.0
-                    device_y = (floor_number - 1) * warehouse.floor_height
-                    device_z = 0.0
-                health_val = int(row.get("Health Score", 100))
-                device = InstalledDevice(
-                    warehouse_id=warehouse_id,
-                    product_id=product.id,
-                    serial_number=serial or generate_serial_number(product.product_code),
-                    floor_number=floor_number,
-                    position_x=device_x,
-                    position_y=device_y,
-                    position_z=device_z,
-                    installation_date=datetime.utcnow(),
-                    warranty_expiry=calculate_warranty_expiry(datetime.utcnow(), product.warranty_years),
-                    health_score=health_val,
-                    status="Healthy" if health_val >= 80 else "Warning" if health_val >= 50 else "Critical",
-                    notes=row.get("Notes", "Imported from Excel")
-                )
-                db.add(device)
-                installed_devices.append(device)
-        
-        except Exception as e:
-            errors.append(f"Row {idx + 2}: {str(e)}")
-    
-    db.commit()
-    
+    consecutive_errors = 0
+
+    # Fetch the product catalog once instead of one ILIKE query per row
+    result = await db.execute(select(Product))
+    catalog = result.scalars().all()
+    products_by_name = {p.name.lower(): p for p in catalog}
+
+    # warranty_years takes only a handful of distinct values; precompute
+    # the expiry offsets once instead of per installed device
+    warranty_delta = {p.warranty_years: timedelta(days=365 * p.warranty_years) for p in catalog}
+
+    def resolve_product(component_name: str):
+        """Match a spreadsheet component name to a catalog product"""
+        name_lower = component_name.lower()
+        product = products_by_name.get(name_lower)
+        if product:
+            return product
+        # Fuzzy fallback: component name contained in a product name
+        for prod_name, prod in products_by_name.items():
+            if name_lower in prod_name:
+                return prod
+        return None
+
+    # Pull each column out as a NumPy array once; iterating arrays avoids
+    # the per-row Series construction that makes df.iterrows() slow
+    row_count = len(df)
+
+    def column(name, default=None):
+        """Column values as a NumPy array, default-filled if missing"""
+        if name in df.columns:
+            return df[name].to_numpy()
+        return np.full(row_count, default, dtype=object)
+
+    def numeric_column(name, default):
+        """Column coerced to float64, NaN where the cell isn't numeric"""
+        if name in df.columns:
+            return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float)
+        return np.full(row_count, default, dtype=float)
+
+    def text_column(name, default=None):
+        """Column as objects with NaN cells replaced by the default"""
+        if name in df.columns:
+            return df[name].astype(object).where(df[name].notna(), default).to_numpy()
+        return np.full(row_count, default, dtype=object)
+
+    name_column = "Component Name" if "Component Name" in df.columns else "ComponentName"
+    names_arr = column(name_column)
+    serials_arr = text_column("Serial")
+    notes_arr = text_column("Notes", "Imported from Excel")
+    pos_x_arr = numeric_column("Position X", np.nan)
+    pos_y_arr = numeric_column("Position Y", np.nan)
+    pos_z_arr = numeric_column("Position Z", np.nan)
+
+    # Validate the numeric columns in one vectorized pass so the row loop
+    # below runs without per-row casts or try/except
+    quantities_raw = numeric_column("Quantity", 1)
+    floors_raw = numeric_column("Floor Number", 1)
+    health_raw = numeric_column("Health Score", 100)
+    invalid_numeric = np.isnan(quantities_raw) | np.isnan(floors_raw) | np.isnan(health_raw)
+    quantities_arr = np.nan_to_num(quantities_raw).astype(int)
+    floors_arr = np.nan_to_num(floors_raw).astype(int)
+    health_arr = np.nan_to_num(health_raw).astype(int)
+
+    # One timestamp for the whole batch; the rows are logically installed
+    # at the same moment and this keeps clock reads out of the hot loop
+    now = datetime.utcnow()
+
+    # Process each row; validation already happened, so the happy path runs
+    # without exception handling
+    for idx, (component_name, row_quantity, row_floor, pos_x, pos_y, pos_z,
+              row_serial, row_health, row_notes) in enumerate(
+            zip(names_arr, quantities_arr, floors_arr, pos_x_arr, pos_y_arr,
+                pos_z_arr, serials_arr, health_arr, notes_arr)):
+        # Map component name to product
+        if component_name is None or pd.isna(component_name):
+            errors.append(f"Row {idx + 2}: Missing component name")
+            consecutive_errors += 1
+            if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                break
+            continue
+
+        if invalid_numeric[idx]:
+            errors.append(f"Row {idx + 2}: Invalid Quantity/Floor Number/Health Score value")
+            consecutive_errors += 1
+            if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                break
+            continue
+
+        # Find product by name (fuzzy matching) in the cached catalog
+        product = resolve_product(str(component_name))
+
+        if not product:
+            errors.append(f"Row {idx + 2}: Product '{component_name}' not found in catalog")
+            consecutive_errors += 1
+            if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                break
+            continue
+
+        quantity = int(row_quantity)
+        floor_number = int(row_floor)
+        health_val = int(row_health)
+
+        # Convert optional coordinates (relative to front door at 0,0,0)
+        # to float if provided, otherwise None
+        coord_x = float(pos_x) if pd.notna(pos_x) else None
+        coord_y = float(pos_y) if pd.notna(pos_y) else None
+        coord_z = float(pos_z) if pd.notna(pos_z) else None
+
+        # Serial prefix is per-product; hoist it out of the quantity fan-out
+        serial_prefix = product.product_code[:3].upper()
+
+        # Install multiple devices if quantity > 1
+        for q in range(quantity):
+            serial = row_serial
+            if serial and quantity > 1:
+                serial = f"{serial}-{q + 1}"
+
+            # If coordinates provided, use them; otherwise use default (0, floor_height, 0)
+            if coord_x is not None and coord_z is not None:
+                # Use provided coordinates
+                device_x = coord_x
+                device_z = coord_z
+                # If Y not provided, calculate from floor
+                device_y = coord_y if coord_y is not None else (floor_number - 1) * warehouse.floor_height
+            else:
+                # No coordinates - place at origin for manual positioning
+                device_x = 0.0
+                device_y = (floor_number - 1) * warehouse.floor_height
+                device_z = 0.0
+            serial_number = serial or f"SN-{serial_prefix}-{random.randrange(1_000_000):06d}"
+            pending_rows.append({
+                "warehouse_id": warehouse_id,
+                "product_id": product.id,
+                "serial_number": serial_number,
+                "floor_number": floor_number,
+                "position_x": device_x,
+                "position_y": device_y,
+                "position_z": device_z,
+                "rotation_y": 0.0,
+                "installation_date": now,
+                "warranty_expiry": now + warranty_delta[product.warranty_years],
+                "health_score": health_val,
+                "status": "Healthy" if health_val >= 80 else "Warning" if health_val >= 50 else "Critical",
+                "notes": row_notes,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now
+            })
+            installed_serials.append(serial_number)
+        consecutive_errors = 0
+
+    # Fail fast on a wholesale mismatch instead of grinding through (and
+    # committing) the rest of a bad sheet
+    if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Aborted after {MAX_CONSECUTIVE_ERRORS} consecutive row errors; first error: {errors[0]}"
+        )
+
+    # Single bulk load instead of one ORM add() per device
+    if pending_rows:
+        await bulk_insert_devices(db, pending_rows)
+        # The row dicts aren't needed past the insert; drop them so a large
+        # upload isn't held alive through the commit and serialization
+        pending_rows = []
+    await db.commit()
+
     return {
         "success": True,
-        "installed_count": len(installed_devices),
+        "installed_count": len(installed_serials),
         "errors": errors,
-        "devices": [d.serial_number for d in installed_devices]
+        "devices": installed_serials
     }
 
 # ============================================================
@@ -307,47 +503,64 @@ async def upload_excel_plan(
 # ============================================================
 
 @app.get("/devices/warranty-alerts/{warehouse_id}", response_model=List[schemas.WarrantyAlert])
-def get_warranty_alerts(warehouse_id: int, days_threshold: int = 90, db: Session = Depends(get_db)):
+async def get_warranty_alerts(warehouse_id: int, days_threshold: int = 90, db: AsyncSession = Depends(get_db)):
     """Get devices with expiring warranties"""
     today = datetime.utcnow()
     threshold_date = today + timedelta(days=days_threshold)
-    
-    devices = db.query(InstalledDevice).filter(
-        InstalledDevice.warehouse_id == warehouse_id,
-        InstalledDevice.is_active == True,
-        InstalledDevice.warranty_expiry <= threshold_date
-    ).all()
-    
-    alerts = []
-    for device in devices:
-        days_remaining = (device.warranty_expiry - today).days
-        
-        if days_remaining < 0:
-            status = "expired"
-        elif days_remaining < 30:
-            status = "critical"
-        else:
-            status = "expiring_soon"
-        
-        alerts.append(schemas.WarrantyAlert(
-            device_id=device.id,
-            serial_number=device.serial_number,
-            product_name=device.product.name,
-            warranty_expiry=device.warranty_expiry,
-            days_remaining=days_remaining,
+
+    result = await db.execute(
+        select(
+            InstalledDevice.id,
+            InstalledDevice.serial_number,
+            InstalledDevice.warranty_expiry,
+            Product.name
+        )
+        .join(Product, InstalledDevice.product_id == Product.id)
+        .where(
+            InstalledDevice.warehouse_id == warehouse_id,
+            InstalledDevice.is_active == True,
+            InstalledDevice.warranty_expiry <= threshold_date
+        )
+    )
+    rows = result.all()
+    if not rows:
+        return []
+
+    device_ids, serial_numbers, expiries, product_names = zip(*rows)
+
+    # Vectorized date arithmetic: one NumPy subtraction and a branchless
+    # np.select instead of per-device Python datetime math
+    expiry_arr = np.array(expiries, dtype="datetime64[us]")
+    days_arr = np.floor(
+        (expiry_arr - np.datetime64(today, "us")) / np.timedelta64(1, "D")
+    ).astype(int)
+    status_arr = np.select(
+        [days_arr < 0, days_arr < 30],
+        ["expired", "critical"],
+        default="expiring_soon"
+    )
+
+    return [
+        schemas.WarrantyAlert(
+            device_id=device_id,
+            serial_number=serial_number,
+            product_name=product_name,
+            warranty_expiry=expiry,
+            days_remaining=int(days_remaining),
             status=status
-        ))
-    
-    return alerts
+        )
+        for device_id, serial_number, expiry, product_name, days_remaining, status
+        in zip(device_ids, serial_numbers, expiries, product_names, days_arr, status_arr)
+    ]
 
 # ============================================================
 # SEED DATA ENDPOINT (For Testing)
 # ============================================================
 
 @app.post("/seed-data/")
-def seed_demo_data(db: Session = Depends(get_db)):
+async def seed_demo_data(db: AsyncSession = Depends(get_db)):
     """Populate database with Schneider Electric products"""
-    
+
     products_data = [
         {
             "product_code": "GALAXY_VL_500",
@@ -440,18 +653,25 @@ def seed_demo_data(db: Session = Depends(get_db)):
             "description": "Rooftop photovoltaic inverter system"
         }
     ]
-    
-    created_products = []
-    for product_data in products_data:
-        # Check if already exists
-        existing = db.query(Product).filter(Product.product_code == product_data["product_code"]).first()
-        if not existing:
-            product = Product(**product_data)
-            db.add(product)
-            created_products.append(product_data["product_code"])
-    
-    db.commit()
-    
+
+    # One IN query for the existing codes instead of one SELECT per product
+    result = await db.execute(
+        select(Product.product_code).where(
+            Product.product_code.in_([p["product_code"] for p in products_data])
+        )
+    )
+    existing_codes = set(result.scalars().all())
+
+    missing = [p for p in products_data if p["product_code"] not in existing_codes]
+    created_products = [p["product_code"] for p in missing]
+
+    # add_all flushes the whole batch in one go (the seed dicts have
+    # heterogeneous keys, which a raw Core executemany can't take)
+    db.add_all(Product(**product_data) for product_data in missing)
+    await db.commit()
+    if created_products:
+        invalidate_products()
+
     return {
         "message": "Demo data seeded successfully",
         "products_created": len(created_products),
@@ -460,4 +680,4 @@ def seed_demo_data(db: Session = Depends(get_db)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -63,7 +63,15 @@ class Warehouse(Base):
 class InstalledDevice(Base):
     """Actual devices installed in a warehouse"""
     __tablename__ = "installed_devices"
-    
+
+    # Compound indexes for the hot per-warehouse queries
+    # (device listing and warranty alerts)
+    __table_args__ = (
+        Index("ix_devices_warehouse_active", "warehouse_id", "is_active"),
+        Index("ix_devices_warehouse_active_warranty", "warehouse_id", "is_active", "warranty_expiry"),
+    )
+
+
     id = Column(Integer, primary_key=True, index=True)
     warehouse_id = Column(Integer, ForeignKey("warehouses.id"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -0,0 +1,55 @@
+"""
+Shared Excel helpers for the test scripts
+"""
+import os
+from pathlib import Path
+
+import pandas as pd
+
+def find_xlsx(name):
+    """Locate a spreadsheet in the cwd or Downloads folder.
+
+    One scandir pass per directory instead of stat()ing candidate paths
+    one by one; DirEntry carries the stat info from the scan itself.
+    """
+    for directory in (Path.cwd(), Path.home() / "Downloads"):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == name:
+                        return Path(entry.path)
+        except OSError:
+            continue
+    return None
+
+# The columns the test scripts actually consume; everything else is
+# skipped at parse time
+SHEET_COLUMNS = ["Component Name", "Quantity", "Floor Number",
+                 "Position X", "Position Y", "Position Z"]
+
+def load_sheet(path, usecols=SHEET_COLUMNS):
+    """Read an Excel sheet, caching the parsed DataFrame next to the file.
+
+    read_excel re-parses the whole .xlsx XML tree on every run; a parquet
+    cache keyed by the source file's mtime makes repeat runs (and the
+    second script in a test session) near-instant. Only the columns in
+    usecols are parsed; the filter is a callable so sheets missing some
+    of them still load.
+    """
+    cache = path.with_suffix(".parquet")
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        return pd.read_parquet(cache)
+
+    # Prefer the Rust-backed calamine engine over the default openpyxl
+    # DOM parser; fall back when python-calamine isn't installed
+    column_filter = (lambda c: c in usecols) if usecols else None
+    try:
+        df = pd.read_excel(path, engine="calamine", usecols=column_filter)
+    except ImportError:
+        df = pd.read_excel(path, usecols=column_filter)
+    try:
+        df.to_parquet(cache)
+    except Exception:
+        # No parquet engine installed - skip caching, keep working
+        pass
+    return df
@@ -2,19 +2,20 @@
 Excel File Validator
 Quick check of Excel file structure
 """
-import pandas as pd
 from pathlib import Path
 
+from openpyxl import load_workbook
+
+from excel_utils import find_xlsx
+
 print("=" * 50)
 print("📊 Excel File Validator")
 print("=" * 50)
 
-# Find Excel file
-excel_path = Path("warehouse_CORRECTED.xlsx")
-if not excel_path.exists():
-    excel_path = Path.home() / "Downloads" / "warehouse_CORRECTED.xlsx"
+# Find Excel file (single directory scan per location)
+excel_path = find_xlsx("warehouse_CORRECTED.xlsx")
 
-if not excel_path.exists():
+if excel_path is None:
     print("\n❌ File not found: warehouse_CORRECTED.xlsx")
     print(f"Checked locations:")
     print(f"  - {Path.cwd()}")
@@ -23,37 +24,53 @@ if not excel_path.exists():
 
 print(f"\n✅ Found: {excel_path}")
 
-# Read Excel
-df = pd.read_excel(excel_path)
+# Stream the sheet with openpyxl's read-only iterator: rows arrive as
+# plain tuples, with no DataFrame and no full-sheet XML tree in memory
+wb = load_workbook(excel_path, read_only=True, data_only=True)
+ws = wb.active
+
+rows_iter = ws.iter_rows(values_only=True)
+header = next(rows_iter, ())
+col_index = {name: i for i, name in enumerate(header) if name is not None}
+
+def cell(row, name, default=None):
+    """Value of a named column in a row tuple, or the default"""
+    i = col_index.get(name)
+    if i is None or i >= len(row) or row[i] is None:
+        return default
+    return row[i]
+
+data_rows = list(rows_iter)
+wb.close()
 
 print(f"\n📋 File Info:")
-print(f"  Total Rows: {len(df)}")
-print(f"  Total Columns: {len(df.columns)}")
+print(f"  Total Rows: {len(data_rows)}")
+print(f"  Total Columns: {len(col_index)}")
 
 print(f"\n📝 Column Names:")
-for i, col in enumerate(df.columns, 1):
-    print(f"  {i}. '{col}'")
+print("\n".join(f"  {i}. '{col}'" for i, col in enumerate(col_index, 1)))
 
 print(f"\n🔍 Required Columns Check:")
 required = ["Component Name", "Quantity", "Floor Number"]
 for col in required:
-    if col in df.columns:
+    if col in col_index:
         print(f"  ✅ '{col}' - Found")
     else:
         print(f"  ❌ '{col}' - MISSING")
 
 print(f"\n📦 Component Names:")
-for idx, row in df.iterrows():
-    comp = row.get("Component Name", "N/A")
-    qty = row.get("Quantity", "N/A")
-    floor = row.get("Floor Number", "N/A")
-    x = row.get("Position X", "N/A")
-    y = row.get("Position Y", "N/A")
-    z = row.get("Position Z", "N/A")
-    
-    has_coords = "✅ Has coords" if pd.notna(x) and pd.notna(z) else "⚠️  No coords"
-    
-    print(f"  Row {idx+2}: '{comp}' (Qty: {qty}, Floor: {floor}) {has_coords}")
+row_lines = []
+for idx, row in enumerate(data_rows, 2):
+    comp = cell(row, "Component Name", "N/A")
+    qty = cell(row, "Quantity", "N/A")
+    floor = cell(row, "Floor Number", "N/A")
+    x = cell(row, "Position X")
+    z = cell(row, "Position Z")
+
+    has_coords = "✅ Has coords" if x is not None and z is not None else "⚠️  No coords"
+
+    row_lines.append(f"  Row {idx}: '{comp}' (Qty: {qty}, Floor: {floor}) {has_coords}")
+print("\n".join(row_lines))
 
 print(f"\n✅ Excel file is valid!")
 print("=" * 50)